@@ -1,22 +1,24 @@
 """Api Client."""
 
+import functools
 import inspect
+import json
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any, assert_never
+from urllib.parse import urlencode
 
 import pydantic
-from pydantic import TypeAdapter
 
 from .api_definition import ApiDefinition
-from .request_params import Body, Header, Path, Query
 from .route import Route
 
 
 class ApiClientEngine(StrEnum):
     AIOHTTP = "aiohttp"
     HTTPX = "httpx"
+    HTTPX_ASYNC = "httpx_async"
     PYODIDE = "pyodide"
     PYSCRIPT = "pyscript"
     REQUESTS = "requests"
@@ -58,7 +60,7 @@ class ValidationError(CommunicationError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     """A description of an HTTP request."""
 
@@ -69,38 +71,201 @@ class Request:
     headers: dict | None
 
 
+ACCESSOR_RESERVED_NAMES = frozenset(
+    (
+        "__args",
+        "__kwargs",
+        "__arguments",
+        "__request",
+        "__get_request",
+        "__transport",
+        "__validate_result",
+        "__bind",
+        "__missing",
+        "__defaults",
+    )
+)
+# Prefix of the positional-only slots that the generated accessors add for positional-or-keyword parameters.
+ACCESSOR_RESERVED_PREFIX = "__positional_"
+
+
+@functools.cache
+def compile_accessor_factory(source: str) -> Callable:
+    # Routes with the same parameter layout generate the same source, so each shape is only compiled once.
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<rest_rpc accessor>", "exec"), namespace)  # noqa: S102 (source is generated, not user input)
+    return namespace["factory"]
+
+
+def make_accessor(
+    route: Route,
+    get_request: Callable[[dict[str, Any]], Request],
+    transport: Callable[[Request], Any],
+    validate_result: Callable[[Request, Any], Any],
+    is_async: bool,
+) -> Callable:
+    # Generates an accessor with the exact parameters of the route definition, so that Python itself binds the
+    # arguments instead of `inspect.Signature.bind()` on every call. Invalid calls (missing, surplus, duplicate or
+    # unknown arguments) are routed through `Signature.bind()` to get the usual error. The accessor calls the request
+    # building, the transport and the result validation directly, without another wrapper frame in between.
+    signature = route.signature
+    missing = object()
+    positional_params: list[str] = []
+    keyword_params: list[str] = []
+    positional_values: list[str] = []
+    keyword_values: list[str] = []
+    defaults: list[Any] = []
+    invalid_conditions = ["__args", "__kwargs"]
+    arguments: list[str] = []
+    for i, (pname, param) in enumerate(signature.parameters.items()):
+        if pname in ACCESSOR_RESERVED_NAMES or pname.startswith(
+            ACCESSOR_RESERVED_PREFIX
+        ):
+            raise ValueError(
+                f'Unable to add accessor for route "{route.name}". Parameter name "{pname}" is reserved.'
+            )
+        default: str | None = None
+        if param.default is not inspect.Parameter.empty:
+            default = f"__defaults[{len(defaults)}]"
+            defaults.append(param.default)
+        if param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            # Positional and keyword arguments land in separate parameters, so that passing both is detected here
+            # instead of raising a `TypeError` before the accessor is even entered.
+            slot = f"{ACCESSOR_RESERVED_PREFIX}{i}"
+            positional_params.append(f"{slot}=__missing")
+            positional_values.append(slot)
+            keyword_params.append(f"{pname}=__missing")
+            keyword_values.append(pname)
+            if default is None:
+                invalid_conditions.append(
+                    f"({slot} is __missing) is ({pname} is __missing)"
+                )
+                value = f"{pname} if {slot} is __missing else {slot}"
+            else:
+                invalid_conditions.append(
+                    f"({slot} is not __missing and {pname} is not __missing)"
+                )
+                value = f"{slot} if {slot} is not __missing else {default} if {pname} is __missing else {pname}"
+        else:
+            if param.kind == inspect.Parameter.POSITIONAL_ONLY:
+                positional_params.append(f"{pname}={default or '__missing'}")
+                positional_values.append(pname)
+            else:
+                keyword_params.append(f"{pname}={default or '__missing'}")
+                keyword_values.append(pname)
+            if default is None:
+                invalid_conditions.append(f"{pname} is __missing")
+            value = pname
+        arguments.append(f"{pname!r}: {value}")
+    params = [
+        *positional_params,
+        *(["/"] if positional_params else []),
+        "*__args",
+        *keyword_params,
+        "**__kwargs",
+    ]
+    source = (
+        "def factory(__get_request, __transport, __validate_result, __bind, __missing, __defaults):\n"
+        f"    {'async ' if is_async else ''}def accessor({', '.join(params)}):\n"
+        f"        if {' or '.join(invalid_conditions)}:\n"
+        f"            __arguments = __bind(({''.join(f'{v}, ' for v in positional_values)}), "
+        f"{{{', '.join(f'{v!r}: {v}' for v in keyword_values)}}}, __args, __kwargs)\n"
+        "        else:\n"
+        f"            __arguments = {{{', '.join(arguments)}}}\n"
+        "        __request = __get_request(__arguments)\n"
+        f"        return __validate_result(__request, {'await ' if is_async else ''}__transport(__request))\n"
+        "    return accessor\n"
+    )
+
+    def bind(
+        positional: tuple, keywords: dict[str, Any], args: tuple, kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        # Replays the call as it was made, so that `Signature.bind()` reports the same error Python would.
+        bind_args = [v for v in positional if v is not missing]
+        bind_kwargs = {pname: v for (pname, v) in keywords.items() if v is not missing}
+        try:
+            bound = signature.bind(*bind_args, *args, **bind_kwargs, **kwargs)
+        except TypeError as e:
+            raise ValueError(
+                f'Unable to use accessor for route "{route.name}": {e}'
+            ) from e
+        bound.apply_defaults()
+        return bound.arguments
+
+    factory = compile_accessor_factory(source)
+    accessor = factory(
+        get_request, transport, validate_result, bind, missing, tuple(defaults)
+    )
+    # Make the accessor look like the route definition to `inspect.signature()`, `help()` and friends. `__defaults__`
+    # is left alone, because the generated function relies on its own sentinel defaults.
+    accessor.__name__ = route.name
+    accessor.__qualname__ = route.name
+    accessor.__signature__ = signature
+    accessor.__annotations__ = dict(route.raw_annotations)
+    return accessor
+
+
 class ApiClient:
     """Class for API clients.
 
+    The accessors share their namespace with the client itself. Routes named `close` or `aclose`, or like one of the
+    client's attributes (`api_def`, `engine`, `base_url`, `app`, `testclient`, `transport`, `is_async`, and `session`
+    for engine `"aiohttp"`), are rejected with a `ValueError`.
+
     Args:
         api_def (ApiDefinition): The [`ApiDefinition`](#rest_rpc.api_definition.ApiDefinition) instance to generate the
             client for. For each route in the `ApiDefinition` instance, an accessor function with the same name will be
             generated.
-        engine (str): The engine to use. Valid values are `"aiohttp"`, `"httpx"`, `"pyodide"`, `"pyscript"`,
-            `"requests"`, `"urllib3"`, `"testclient"`, and `"custom"`. This determines which HTTP library is used
-            internally.
+        engine (str): The engine to use. Valid values are `"aiohttp"`, `"httpx"`, `"httpx_async"`, `"pyodide"`,
+            `"pyscript"`, `"requests"`, `"urllib3"`, `"testclient"`, and `"custom"`. This determines which HTTP library
+            is used internally.
         app (fastapi.FastAPI, optional): Required iff engine is `"testclient"`. FastAPI app to make requests on.
-        base_url (str, optional): Required iff engine is one of `("aiohttp", "httpx", "pyodide", "pyscript",
-            "requests", "urllib3")`. This is the base URL that is prepended to the route paths.
+        base_url (str, optional): Required iff engine is one of `("aiohttp", "httpx", "httpx_async", "pyodide",
+            "pyscript", "requests", "urllib3")`. This is the base URL that is prepended to the route paths.
         is_async (bool | None, optional): When engine is `"custom"`, explicitly state if `transport` is as `async`
             function (`True`, `False`) or let the library decide (`None`). Defaults to `None`.
+        json_loads (Callable[[bytes], Any] | None, optional): When engine is one of `("aiohttp", "httpx",
+            "httpx_async", "requests", "urllib3", "testclient")`, the function used to decode the raw response body
+            before it is validated.
+            Defaults to `None`, in which case Pydantic parses and validates the raw body in a single step. This
+            uses Pydantic's JSON mode: strict models accept JSON strings for types like `datetime`, and bodies that
+            are not UTF-8 raise a [`DecodeError`](#rest_rpc.api_client.DecodeError). Pass e.g. `json.loads` to get
+            Python-mode validation of the decoded body instead (which also accepts UTF-16 and UTF-32 bodies).
         session (aiohttp.ClientSession, optional): Required iff engine is `"aiohttp"`.
         transport (Callable[[Request], object], optional): Required iff engine is `"custom"`. Transport function to
             use for requests.
     """
 
     @staticmethod
+    @functools.cache
     def _get_init_signature(engine: ApiClientEngine):
         dummy = None
         match engine:
             case ApiClientEngine.AIOHTTP:
                 import aiohttp
 
-                def dummy(*, base_url: str, session: aiohttp.ClientSession) -> None: ...
+                def dummy(
+                    *,
+                    base_url: str,
+                    session: aiohttp.ClientSession,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
 
             case ApiClientEngine.HTTPX:
 
-                def dummy(*, base_url: str) -> None: ...
+                def dummy(
+                    *,
+                    base_url: str,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
+
+            case ApiClientEngine.HTTPX_ASYNC:
+
+                def dummy(
+                    *,
+                    base_url: str,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
 
             case ApiClientEngine.PYSCRIPT:
 
@@ -115,16 +280,28 @@ class ApiClient:
 
             case ApiClientEngine.REQUESTS:
 
-                def dummy(*, base_url: str) -> None: ...
+                def dummy(
+                    *,
+                    base_url: str,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
 
             case ApiClientEngine.URLLIB3:
 
-                def dummy(*, base_url: str) -> None: ...
+                def dummy(
+                    *,
+                    base_url: str,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
 
             case ApiClientEngine.TESTCLIENT:
                 from fastapi import FastAPI
 
-                def dummy(*, app: FastAPI) -> None: ...
+                def dummy(
+                    *,
+                    app: FastAPI,
+                    json_loads: Callable[[bytes], Any] | None = None,
+                ) -> None: ...
 
             case ApiClientEngine.CUSTOM:
 
@@ -144,53 +321,53 @@ class ApiClient:
         route: Route,
         transport: Callable[[Request], object],
         is_async: bool | None = None,
+        raw_response: bool = False,
     ):
-        def get_request(signature: inspect.Signature, *args, **kwargs) -> Request:
-            def header_name(pname: str, header: Header) -> str:
-                args = header.bound_args.arguments
-                if args.get("serialization_alias") is not None:
-                    return args["serialization_alias"]
-                if args.get("alias") is not None:
-                    return args["alias"]
-                return pname.replace("_", "-")
-
-            try:
-                bound = signature.bind(*args, **kwargs)
-            except TypeError as e:
-                raise ValueError(
-                    f'Unable to use accessor for route "{route.name}": {e}'
-                ) from e
-
-            bound.apply_defaults()
-            for pname, value in bound.arguments.items():
-                param = signature.parameters[pname]
+        def get_request(arguments: dict[str, Any]) -> Request:
+            if route.simple_param_types is None or not all(
+                type(arguments[pname]) in tps
+                for (pname, tps) in route.simple_param_types.items()
+            ):
                 try:
-                    TypeAdapter(param.annotation).validate_python(value)
+                    route.get_params_adapter().validate_python(arguments)
                 except pydantic.ValidationError as e:
+                    # Error locations can be aliases, so only trust the ones naming an actual parameter.
+                    pname = next(
+                        (
+                            error["loc"][0]
+                            for error in e.errors()
+                            if error["loc"] and error["loc"][0] in signature.parameters
+                        ),
+                        None,
+                    )
+                    if pname is None:
+                        raise ValueError(
+                            f'Illegal arguments for route "{route.name}": {e}'
+                        ) from e
                     raise ValueError(
                         f'Illegal type for parameter "{pname}". '
-                        f'Expected "{param.annotation}", got "{type(value)}".'
+                        f'Expected "{signature.parameters[pname].annotation}", got "{type(arguments[pname])}".'
                     ) from e
             path = route.path
+            if route.path_param_names:
+                path = route.path_template.format_map(
+                    {pname: str(arguments[pname]) for pname in route.path_param_names}
+                )
             query_params: dict | None = None
+            if route.query_param_names:
+                query_params = {
+                    pname: arguments[pname] for pname in route.query_param_names
+                }
             body: dict | None = None
+            if route.body_param_name is not None:
+                value = arguments[route.body_param_name]
+                body = route.get_body_adapter(value.__class__).dump_python(value)
             headers: dict | None = None
-            for pname, req_param in route.request_params.items():
-                value = bound.arguments[pname]
-                if isinstance(req_param, Path):
-                    path = path.replace(f"{{{pname}}}", str(value))
-                elif isinstance(req_param, Query):
-                    if query_params is None:
-                        query_params = {}
-                    query_params[pname] = value
-                elif isinstance(req_param, Body):
-                    type_adapter = TypeAdapter(value.__class__)
-                    body = type_adapter.dump_python(value)
-                elif isinstance(req_param, Header):
-                    if headers is None:
-                        headers = {}
-                    header_key = header_name(pname, req_param)
-                    headers[header_key] = value
+            if route.header_names:
+                headers = {
+                    header_key: arguments[pname]
+                    for (pname, header_key) in route.header_names.items()
+                }
             return Request(
                 route.method,
                 path,
@@ -199,14 +376,27 @@ class ApiClient:
                 headers,
             )
 
-        def validate_result(
-            signature: inspect.Signature, request: Request, json_data: Any
-        ) -> Any:
+        def validate_result(request: Request, json_data: Any) -> Any:
             try:
-                return TypeAdapter(signature.return_annotation).validate_python(
-                    json_data
-                )
+                if raw_response:
+                    return route.return_adapter.validate_json(json_data)
+                if (
+                    route.simple_return_types is not None
+                    and type(json_data) in route.simple_return_types
+                ):
+                    return json_data
+                return route.return_adapter.validate_python(json_data)
             except pydantic.ValidationError as e:
+                if raw_response and any(
+                    error["type"] == "json_invalid" for error in e.errors()
+                ):
+                    raise DecodeError(
+                        route,
+                        path=request.path,
+                        query_params=request.query_params,
+                        body=request.body,
+                        headers=request.headers,
+                    ) from e
                 raise ValidationError(
                     route,
                     path=request.path,
@@ -220,31 +410,24 @@ class ApiClient:
         if is_async is None:
             is_async = inspect.iscoroutinefunction(transport)
 
-        if is_async:
-
-            async def accessor(*args, **kwargs):
-                request = get_request(signature, *args, **kwargs)
-                json_data = await transport(request)
-                return validate_result(signature, request, json_data)
-
-        else:
-
-            def accessor(*args, **kwargs):
-                request = get_request(signature, *args, **kwargs)
-                json_data = transport(request)
-                return validate_result(signature, request, json_data)
-
-        setattr(self, route.name, accessor)
+        setattr(
+            self,
+            route.name,
+            make_accessor(route, get_request, transport, validate_result, is_async),
+        )
 
     def _add_accessor_with_aiohttp(self, route: Route):
         import aiohttp
 
+        # The base URL is fixed, so it only needs to be normalized once per route.
+        base_url = self.base_url.rstrip("/")
+
         async def transport(
             request: Request,
         ):
             try:
-                url = self.base_url.rstrip("/") + request.path
-                async with self.session.request(
+                url = base_url + request.path
+                async with self._session.request(
                     method=request.method,
                     url=url,
                     params=request.query_params,
@@ -252,8 +435,11 @@ class ApiClient:
                     headers=request.headers,
                     raise_for_status=True,
                 ) as response:
+                    raw = await response.read()
+                    if self._json_loads is None:
+                        return raw
                     try:
-                        return await response.json()
+                        return self._json_loads(raw)
                     except Exception as e:
                         raise DecodeError(
                             route,
@@ -280,13 +466,15 @@ class ApiClient:
                     headers=request.headers,
                 ) from e
 
-        self._add_accessor(route, transport, is_async=True)
+        self._add_accessor(
+            route, transport, is_async=True, raw_response=self._json_loads is None
+        )
 
     def _add_accessor_with_httpx(self, route: Route):
-        import json
-
         import httpx
 
+        base_url = self.base_url.rstrip("/")
+
         def transport(
             request: Request,
         ):
@@ -295,9 +483,9 @@ class ApiClient:
             query_params = request.query_params
             body = request.body
             headers = request.headers
-            url = self.base_url.rstrip("/") + path
+            url = base_url + path
             try:
-                response = httpx.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     params=query_params,
@@ -325,9 +513,11 @@ class ApiClient:
                     response=response,
                 ) from e
 
+            if self._json_loads is None:
+                return response.content
             try:
-                return response.json()
-            except json.JSONDecodeError as e:
+                return self._json_loads(response.content)
+            except Exception as e:
                 raise DecodeError(
                     route,
                     url=url,
@@ -337,18 +527,80 @@ class ApiClient:
                     response=response,
                 ) from e
 
-        self._add_accessor(route, transport, is_async=False)
+        self._add_accessor(
+            route, transport, is_async=False, raw_response=self._json_loads is None
+        )
 
-    def _add_accessor_with_pyodide(self, route: Route):
-        import json
-        from urllib.parse import urlencode
+    def _add_accessor_with_httpx_async(self, route: Route):
+        import httpx
+
+        base_url = self.base_url.rstrip("/")
+
+        async def transport(
+            request: Request,
+        ):
+            method = request.method
+            path = request.path
+            query_params = request.query_params
+            body = request.body
+            headers = request.headers
+            url = base_url + path
+            try:
+                response = await self._session.request(
+                    method=method,
+                    url=url,
+                    params=query_params,
+                    json=body,
+                    headers=headers,
+                )
+            except httpx.HTTPError as e:
+                raise NetworkError(
+                    route,
+                    url=url,
+                    query_params=query_params,
+                    body=body,
+                    headers=headers,
+                ) from e
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                raise HttpError(
+                    route,
+                    url=url,
+                    query_params=query_params,
+                    body=body,
+                    headers=headers,
+                    response=response,
+                ) from e
+
+            if self._json_loads is None:
+                return response.content
+            try:
+                return self._json_loads(response.content)
+            except Exception as e:
+                raise DecodeError(
+                    route,
+                    url=url,
+                    query_params=query_params,
+                    body=body,
+                    headers=headers,
+                    response=response,
+                ) from e
 
+        self._add_accessor(
+            route, transport, is_async=True, raw_response=self._json_loads is None
+        )
+
+    def _add_accessor_with_pyodide(self, route: Route):
         from pyodide.http import AbortError, HttpStatusError, pyfetch
 
+        base_url = self.base_url.rstrip("/")
+
         async def transport(
             request: Request,
         ):
-            url = self.base_url.rstrip("/") + request.path
+            url = base_url + request.path
             if request.query_params is not None:
                 url += "?" + urlencode(request.query_params)
             fetch_args = {"method": request.method}
@@ -388,15 +640,14 @@ class ApiClient:
         self._add_accessor(route, transport, is_async=True)
 
     def _add_accessor_with_pyscript(self, route: Route):
-        import json
-        from urllib.parse import urlencode
-
         import pyscript
 
+        base_url = self.base_url.rstrip("/")
+
         async def transport(
             request: Request,
         ):
-            url = self.base_url.rstrip("/") + request.path
+            url = base_url + request.path
             if request.query_params is not None:
                 url += "?" + urlencode(request.query_params)
             fetch_args = {"url": url, "method": request.method}
@@ -431,6 +682,8 @@ class ApiClient:
     def _add_accessor_with_requests(self, route: Route):
         import requests
 
+        base_url = self.base_url.rstrip("/")
+
         def transport(
             request: Request,
         ):
@@ -439,9 +692,9 @@ class ApiClient:
             query_params = request.query_params
             body = request.body
             headers = request.headers
-            url = self.base_url.rstrip("/") + path
+            url = base_url + path
             try:
-                response = requests.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     params=query_params,
@@ -469,9 +722,11 @@ class ApiClient:
                     response=response,
                 ) from e
 
+            if self._json_loads is None:
+                return response.content
             try:
-                return response.json()
-            except requests.RequestException as e:
+                return self._json_loads(response.content)
+            except Exception as e:
                 raise DecodeError(
                     route,
                     url=url,
@@ -481,14 +736,15 @@ class ApiClient:
                     response=response,
                 ) from e
 
-        self._add_accessor(route, transport, is_async=False)
+        self._add_accessor(
+            route, transport, is_async=False, raw_response=self._json_loads is None
+        )
 
     def _add_accessor_with_urllib3(self, route: Route):
-        import json
-        from urllib.parse import urlencode
-
         import urllib3
 
+        base_url = self.base_url.rstrip("/")
+
         def transport(
             request: Request,
         ):
@@ -496,7 +752,7 @@ class ApiClient:
             path = request.path
             body = request.body
             headers = request.headers
-            url = self.base_url.rstrip("/") + path
+            url = base_url + path
             if request.query_params is not None:
                 url += "?" + urlencode(request.query_params)
             try:
@@ -523,9 +779,11 @@ class ApiClient:
                     response=response,
                 )
 
+            if self._json_loads is None:
+                return response.data
             try:
-                return response.json()
-            except json.JSONDecodeError as e:
+                return self._json_loads(response.data)
+            except Exception as e:
                 raise DecodeError(
                     route,
                     url=url,
@@ -534,11 +792,11 @@ class ApiClient:
                     response=response,
                 ) from e
 
-        self._add_accessor(route, transport, is_async=False)
+        self._add_accessor(
+            route, transport, is_async=False, raw_response=self._json_loads is None
+        )
 
     def _add_accessor_with_testclient(self, route: Route):
-        import json
-
         import httpx
 
         def transport(
@@ -580,9 +838,11 @@ class ApiClient:
                     response_text=response.text,
                 ) from e
 
+            if self._json_loads is None:
+                return response.content
             try:
-                return response.json()
-            except json.JSONDecodeError as e:
+                return self._json_loads(response.content)
+            except Exception as e:
                 raise DecodeError(
                     route,
                     url=url,
@@ -592,19 +852,22 @@ class ApiClient:
                     response=response,
                 ) from e
 
-        self._add_accessor(route, transport, is_async=False)
+        self._add_accessor(
+            route, transport, is_async=False, raw_response=self._json_loads is None
+        )
 
     def _add_accessor_with_custom(self, route: Route):
         self._add_accessor(route, self.transport, self.is_async)
 
     def __init__(self, api_def: ApiDefinition, engine: str, **kwargs):
-        if engine not in ApiClientEngine:
+        try:
+            self.engine = ApiClientEngine(engine)
+        except ValueError as e:
             raise ValueError(
                 f'Unsupported engine "{engine}". Supported engines are '
                 f"{ {str(e) for e in ApiClientEngine} }."
-            )
+            ) from e
         self.api_def = api_def
-        self.engine = ApiClientEngine(engine)
         sig = self._get_init_signature(self.engine)
         try:
             bound = sig.bind(**kwargs)
@@ -613,35 +876,65 @@ class ApiClient:
                 f'Invalid parameters for ApiClient(engine="{engine}"): {e}'
             ) from e
         bound.apply_defaults()
+        add_accessor: Callable[[Route], None]
         match self.engine:
             case ApiClientEngine.AIOHTTP:
                 self.base_url = bound.arguments["base_url"]
-                self.session = bound.arguments["session"]
+                self._session = bound.arguments["session"]
+                # The session passed by the user stays accessible, as it always has been.
+                self.session = self._session
+                self._json_loads = bound.arguments["json_loads"]
+                add_accessor = self._add_accessor_with_aiohttp
 
             case ApiClientEngine.HTTPX:
+                import httpx
+
                 self.base_url = bound.arguments["base_url"]
+                self._session = httpx.Client()
+                self._json_loads = bound.arguments["json_loads"]
+                add_accessor = self._add_accessor_with_httpx
+
+            case ApiClientEngine.HTTPX_ASYNC:
+                import httpx
+
+                self.base_url = bound.arguments["base_url"]
+                self._session = httpx.AsyncClient()
+                self._json_loads = bound.arguments["json_loads"]
+                add_accessor = self._add_accessor_with_httpx_async
 
             case ApiClientEngine.PYODIDE:
                 self.base_url = bound.arguments["base_url"]
+                add_accessor = self._add_accessor_with_pyodide
 
             case ApiClientEngine.PYSCRIPT:
                 self.base_url = bound.arguments["base_url"]
+                add_accessor = self._add_accessor_with_pyscript
 
             case ApiClientEngine.REQUESTS:
+                import requests
+
                 self.base_url = bound.arguments["base_url"]
+                self._json_loads = bound.arguments["json_loads"]
+                self._session = requests.Session()
+                add_accessor = self._add_accessor_with_requests
 
             case ApiClientEngine.URLLIB3:
                 self.base_url = bound.arguments["base_url"]
+                self._json_loads = bound.arguments["json_loads"]
+                add_accessor = self._add_accessor_with_urllib3
 
             case ApiClientEngine.TESTCLIENT:
                 from fastapi.testclient import TestClient
 
                 self.app = bound.arguments["app"]
+                self._json_loads = bound.arguments["json_loads"]
                 self.testclient = TestClient(self.app)
+                add_accessor = self._add_accessor_with_testclient
 
             case ApiClientEngine.CUSTOM:
                 self.transport = bound.arguments["transport"]
                 self.is_async = bound.arguments["is_async"]
+                add_accessor = self._add_accessor_with_custom
 
             case _:
                 assert_never(self.engine)
@@ -651,22 +944,61 @@ class ApiClient:
                     f'Unable to add accessor for route "{route.name}". '
                     "Name conflicts with ApiClient internals."
                 )
-            match self.engine:
-                case ApiClientEngine.AIOHTTP:
-                    self._add_accessor_with_aiohttp(route)
-                case ApiClientEngine.HTTPX:
-                    self._add_accessor_with_httpx(route)
-                case ApiClientEngine.PYODIDE:
-                    self._add_accessor_with_pyodide(route)
-                case ApiClientEngine.PYSCRIPT:
-                    self._add_accessor_with_pyscript(route)
-                case ApiClientEngine.REQUESTS:
-                    self._add_accessor_with_requests(route)
-                case ApiClientEngine.URLLIB3:
-                    self._add_accessor_with_urllib3(route)
-                case ApiClientEngine.TESTCLIENT:
-                    self._add_accessor_with_testclient(route)
-                case ApiClientEngine.CUSTOM:
-                    self._add_accessor_with_custom(route)
-                case _:
-                    assert_never(self.engine)
+            add_accessor(route)
+
+    def close(self) -> None:
+        """Close the HTTP session that the client created for itself, if any (engines `"httpx"` and `"requests"`).
+        Sessions that were passed to the constructor are left open. The client can also be used as a context manager,
+        which calls this method on exit.
+
+        Raises:
+            TypeError: When engine is `"httpx_async"`, whose session can only be closed with
+                [`aclose()`](#rest_rpc.api_client.ApiClient.aclose) or `async with`.
+
+        Example:
+
+        ```python
+        with ApiClient(api_def, engine="requests", base_url="http://127.0.0.1:8000") as api_client:
+            result = api_client.read_root()
+        ```
+        """
+        self._ensure_sync_lifecycle()
+        if self.engine in (ApiClientEngine.HTTPX, ApiClientEngine.REQUESTS):
+            self._session.close()
+
+    def _ensure_sync_lifecycle(self) -> None:
+        if self.engine == ApiClientEngine.HTTPX_ASYNC:
+            raise TypeError(
+                'ApiClient(engine="httpx_async") has to be closed with "await api_client.aclose()" or '
+                '"async with ApiClient(...) as api_client:".'
+            )
+
+    def __enter__(self):
+        self._ensure_sync_lifecycle()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def aclose(self) -> None:
+        """Close the HTTP session that the client created for itself, if any (engine `"httpx_async"`). This is the
+        `async` counterpart of [`close()`](#rest_rpc.api_client.ApiClient.close). The client can also be used as an
+        `async` context manager, which calls this method on exit.
+
+        Example:
+
+        ```python
+        async with ApiClient(api_def, engine="httpx_async", base_url="http://127.0.0.1:8000") as api_client:
+            results = await asyncio.gather(api_client.read_root(), api_client.read_item(1))
+        ```
+        """
+        if self.engine == ApiClientEngine.HTTPX_ASYNC:
+            await self._session.aclose()
+        else:
+            self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -1,22 +1,23 @@
 """API definition."""
 
 import inspect
-import re
 from typing import Annotated, get_args, get_origin
 
 import pydantic
 from pydantic import TypeAdapter
 
 from .request_params import Body, Path, RequestParam
-from .route import Route
+from .route import PATH_PARAM_PATTERN, Route
 
+SUPPORTED_METHODS = frozenset(("DELETE", "GET", "PATCH", "POST", "PUT"))
+METHODS_SUPPORTING_BODY = frozenset(("PATCH", "POST", "PUT"))
 
-def is_valid_pydantic_type(tp) -> bool:
+
+def make_type_adapter(tp) -> TypeAdapter | None:
     try:
-        TypeAdapter(tp)
+        return TypeAdapter(tp)
     except pydantic.PydanticSchemaGenerationError:
-        return False
-    return True
+        return None
 
 
 def get_request_param(tp) -> RequestParam:
@@ -41,7 +42,7 @@ def get_request_params(
     path: str,
     parameters: list[inspect.Parameter],
 ) -> dict[str, RequestParam]:
-    parameter_names_from_path = set(re.findall(r"\{(.+?)\}", path))
+    parameter_names_from_path = set(PATH_PARAM_PATTERN.findall(path))
     if not parameter_names_from_path.issubset(p.name for p in parameters):
         raise ValueError(
             f"Parameters {parameter_names_from_path.difference(p.name for p in parameters)} are in path, but not in parameters."
@@ -121,10 +122,9 @@ class ApiDefinition:
             name = func.__name__
             if name in self.routes:
                 raise ValueError(f'Unable to add duplicate route "{name}".')
-            SUPPORTED_METHODS = {"DELETE", "GET", "PATCH", "POST", "PUT"}
             if method not in SUPPORTED_METHODS:
                 raise ValueError(
-                    f'Unable to add route "{name}". Method "{method}" is not supported. Supported methods are {SUPPORTED_METHODS}.'
+                    f'Unable to add route "{name}". Method "{method}" is not supported. Supported methods are {set(SUPPORTED_METHODS)}.'
                 )
             if not path.startswith("/"):
                 raise ValueError(
@@ -136,7 +136,8 @@ class ApiDefinition:
                 raise ValueError(
                     f'Unable to add route "{name}" without a return annotation.'
                 )
-            if not is_valid_pydantic_type(signature.return_annotation):
+            return_adapter = make_type_adapter(signature.return_annotation)
+            if return_adapter is None:
                 raise ValueError(
                     f'Unable to add route "{name}". "{signature.return_annotation}" cannot be converted to a Pydantic schema.'
                 )
@@ -153,23 +154,21 @@ class ApiDefinition:
                     f'Unable to add route "{name}". Missing type annotations for parameters {tuple(p.name for p in parameters if p.annotation == EMPTY)}'
                 )
 
-            if (
-                sum(1 for p in parameters if not is_valid_pydantic_type(p.annotation))
-                > 0
-            ):
+            invalid_param_names = tuple(
+                p.name for p in parameters if make_type_adapter(p.annotation) is None
+            )
+            if invalid_param_names:
                 raise ValueError(
-                    f'Unable to add route "{name}". Annotations of parameters {tuple(p.name for p in parameters if not is_valid_pydantic_type(p.annotation))} cannot be converted to pydantic schemas.'
+                    f'Unable to add route "{name}". Annotations of parameters {invalid_param_names} cannot be converted to pydantic schemas.'
                 )
             request_params = get_request_params(path, parameters)
-
-            METHODS_SUPPORTING_BODY = {"PATCH", "POST", "PUT"}
             if method not in METHODS_SUPPORTING_BODY:
                 if (
                     sum(1 for (_, a) in request_params.items() if isinstance(a, Body))
                     > 0
                 ):
                     raise ValueError(
-                        f'Unable to add route "{name}". Request bodies are only support for methods {METHODS_SUPPORTING_BODY}.'
+                        f'Unable to add route "{name}". Request bodies are only support for methods {set(METHODS_SUPPORTING_BODY)}.'
                     )
 
             raw_annotations = func.__annotations__
@@ -182,6 +181,7 @@ class ApiDefinition:
                 raw_annotations,
                 raw_defaults,
                 request_params,
+                return_adapter,
             )
             return func
 
@@ -12,12 +12,9 @@ def ensure_has_request_param_annotations(
     annotations: dict[str, type], request_params: dict[str, RequestParam]
 ) -> dict[str, type]:
     assert "return" in annotations
-    param_annotations = {
-        pname: ptype for (pname, ptype) in annotations.items() if pname != "return"
-    }
-    assert param_annotations.keys() == request_params.keys(), (
+    assert annotations.keys() - {"return"} == request_params.keys(), (
         "Non-matching parameter names",
-        param_annotations,
+        annotations,
         request_params,
     )
     new_annotations = annotations.copy()
@@ -30,9 +27,8 @@ def ensure_has_request_param_annotations(
                 return True
         return False
 
-    for (pname, annotation), request_param in zip(
-        param_annotations.items(), request_params.values()
-    ):
+    for pname, request_param in request_params.items():
+        annotation = annotations[pname]
         if get_origin(annotation) is Annotated:
             if annotated_contains_request_param(annotation, request_param):
                 new_annotations[pname] = annotation
@@ -52,18 +48,10 @@ def convert_annotations_to_fastapi(
     import fastapi
     from fastapi.openapi.models import Example as FastapiExample
 
-    annotations = ensure_has_request_param_annotations(annotations, request_params)
-    assert "return" in annotations
-    param_annotations = {
-        pname: ptype for (pname, ptype) in annotations.items() if pname != "return"
-    }
-    assert param_annotations.keys() == request_params.keys(), (
-        "Non-matching parameter names",
-        param_annotations,
-        request_params,
-    )
-    new_annotations = annotations.copy()
-    for pname, annotation in param_annotations.items():
+    # `ensure_has_request_param_annotations()` already checked that the parameter names match.
+    new_annotations = ensure_has_request_param_annotations(annotations, request_params)
+    for pname in request_params:
+        annotation = new_annotations[pname]
         assert get_origin(annotation) is Annotated
         new_args = []
         for arg in get_args(annotation):
@@ -150,25 +138,23 @@ class ApiImplementation:
                 raise ValueError(
                     f'Unable to add handler "{name}". Return annotation doesn\'t match corresponding route. Expected "{route.signature.return_annotation}", but got "{signature.return_annotation}".'
                 )
-        parameters = signature.parameters.values()
-        expected_parameters = route.signature.parameters.values()
-        if tuple(p.name for p in parameters) != tuple(
-            p.name for p in expected_parameters
-        ):
+        param_names = tuple(signature.parameters)
+        if param_names != route.param_names:
             raise ValueError(
-                f'Unable to add handler "{name}". Parameter names don\'t match corresponding route. Expected {tuple(p.name for p in expected_parameters)}, but got {tuple(p.name for p in parameters)}.'
+                f'Unable to add handler "{name}". Parameter names don\'t match corresponding route. Expected {route.param_names}, but got {param_names}.'
             )
-        for param, exp_param in zip(parameters, expected_parameters):
-            assert param.name == exp_param.name
+        for param, exp_param, exp_annotation in zip(
+            signature.parameters.values(),
+            route.signature.parameters.values(),
+            route.param_types,
+        ):
             pname = param.name
-            assert (exp_annotation := exp_param.annotation) != EMPTY
+            assert exp_annotation != EMPTY
             if (actual_annotation := param.annotation) != EMPTY:
                 if get_origin(actual_annotation) is Annotated:
                     raise ValueError(
                         f'Unable to add handler "{name}". Type annotation of parameter "{pname}" uses Annotated[] which is not supported.'
                     )
-                if get_origin(exp_annotation) is Annotated:
-                    exp_annotation = get_args(exp_annotation)[0]
                 if actual_annotation != exp_annotation:
                     raise ValueError(
                         f'Unable to add handler "{name}". Type annotation of parameter "{pname}" doesn\'t match corresponding route. Expected "{exp_annotation}", but got "{actual_annotation}".'
@@ -211,15 +197,9 @@ class ApiImplementation:
 
         app = FastAPI()
         for name, route_def in self.api_def.routes.items():
-            handler = self.handlers[name]
-            route_def = self.api_def.routes[name]
-            path = route_def.path
-            method = route_def.method
             app.add_api_route(
-                path,
-                endpoint=handler,
-                methods=[
-                    method,
-                ],
+                route_def.path,
+                endpoint=self.handlers[name],
+                methods=[route_def.method],
             )
         return app
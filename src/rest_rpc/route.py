@@ -1,10 +1,58 @@
 import inspect
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from types import NoneType, UnionType
+from typing import Annotated, Union, get_args, get_origin
 
-from .request_params import RequestParam
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import TypedDict
 
+from .request_params import Body, Header, Path, Query, RequestParam
 
-@dataclass
+
+def header_name(pname: str, header: Header) -> str:
+    args = header.bound_args.arguments
+    if args.get("serialization_alias") is not None:
+        return args["serialization_alias"]
+    if args.get("alias") is not None:
+        return args["alias"]
+    return pname.replace("_", "-")
+
+
+# A path parameter placeholder like `{item_id}`.
+PATH_PARAM_PATTERN = re.compile(r"\{(.+?)\}")
+# A path parameter placeholder, or any other brace (which has to be escaped in a `str.format_map()` template).
+PATH_TEMPLATE_PATTERN = re.compile(r"\{(.+?)\}|([{}])")
+
+# Classes for which Pydantic accepts any instance of exactly that class unchanged.
+SIMPLE_TYPES = frozenset((bool, bytes, float, int, str, NoneType))
+
+
+def simple_types(annotation) -> tuple[type, ...] | None:
+    if get_origin(annotation) is Annotated:
+        tp, *metadata = get_args(annotation)
+        if not all(isinstance(m, RequestParam) for m in metadata):
+            return None
+        annotation = tp
+    if annotation is None:
+        return (NoneType,)
+    if get_origin(annotation) in (Union, UnionType):
+        members = tuple(simple_types(arg) for arg in get_args(annotation))
+        if any(m is None for m in members):
+            return None
+        return tuple(tp for m in members for tp in m)
+    if annotation in SIMPLE_TYPES:
+        return (annotation,)
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and annotation.model_config.get("revalidate_instances", "never") == "never"
+    ):
+        return (annotation,)
+    return None
+
+
+@dataclass(slots=True)
 class Route:
     method: str
     path: str
@@ -13,3 +61,91 @@ class Route:
     raw_annotations: dict[str, type]
     raw_defaults: tuple | None
     request_params: dict[str, RequestParam]
+    return_adapter: TypeAdapter
+    params_adapter: TypeAdapter | None = field(init=False)
+    param_names: tuple[str, ...] = field(init=False)
+    param_types: tuple[type, ...] = field(init=False)
+    simple_param_types: dict[str, tuple[type, ...]] | None = field(init=False)
+    simple_return_types: tuple[type, ...] | None = field(init=False)
+    path_param_names: tuple[str, ...] = field(init=False)
+    path_template: str = field(init=False)
+    query_param_names: tuple[str, ...] = field(init=False)
+    header_names: dict[str, str] = field(init=False)
+    body_param_name: str | None = field(init=False)
+    body_type: object = field(init=False)
+    body_adapter: TypeAdapter | None = field(init=False)
+
+    def __post_init__(self):
+        parameters = self.signature.parameters.values()
+        # Only needed by clients, so it's built on first use. See `get_params_adapter()`.
+        self.params_adapter = None
+        self.param_names = tuple(p.name for p in parameters)
+        # The parameter annotations without `Annotated[]`, which is what handlers have to match.
+        self.param_types = tuple(
+            get_args(p.annotation)[0]
+            if get_origin(p.annotation) is Annotated
+            else p.annotation
+            for p in parameters
+        )
+        # If every parameter has a simple type, arguments of exactly these types don't need to be validated.
+        simple_param_types = {p.name: simple_types(p.annotation) for p in parameters}
+        self.simple_param_types = (
+            simple_param_types
+            if all(tps is not None for tps in simple_param_types.values())
+            else None
+        )
+        # Likewise, decoded results of exactly these types don't need to be validated.
+        self.simple_return_types = simple_types(self.signature.return_annotation)
+        # Where each parameter goes in a request, so that accessors don't have to inspect the request params.
+        self.path_param_names = tuple(
+            pname for (pname, a) in self.request_params.items() if isinstance(a, Path)
+        )
+        # `path` as a `str.format_map()` template: placeholders are kept, any other braces are escaped.
+        self.path_template = PATH_TEMPLATE_PATTERN.sub(
+            lambda m: f"{{{m[1]}}}" if m[1] is not None else m[2] * 2,
+            self.path,
+        )
+        self.query_param_names = tuple(
+            pname for (pname, a) in self.request_params.items() if isinstance(a, Query)
+        )
+        self.header_names = {
+            pname: header_name(pname, a)
+            for (pname, a) in self.request_params.items()
+            if isinstance(a, Header)
+        }
+        self.body_param_name = next(
+            (
+                pname
+                for (pname, a) in self.request_params.items()
+                if isinstance(a, Body)
+            ),
+            None,
+        )
+        self.body_type = (
+            self.param_types[self.param_names.index(self.body_param_name)]
+            if self.body_param_name is not None
+            else None
+        )
+        # Only needed by clients, so it's built on first use. See `get_body_adapter()`.
+        self.body_adapter = None
+
+    def get_body_adapter(self, cls: type) -> TypeAdapter:
+        # Serializes a body argument of class `cls`. The adapter for the declared body class is kept, any other class
+        # (e.g. a subclass or a member of a union) gets a fresh one, so that the route never holds on to foreign classes.
+        if cls is not self.body_type:
+            return TypeAdapter(cls)
+        if self.body_adapter is None:
+            self.body_adapter = TypeAdapter(cls)
+        return self.body_adapter
+
+    def get_params_adapter(self) -> TypeAdapter:
+        # Validates all arguments of an accessor call at once. Arguments are always passed by parameter name, so any
+        # Pydantic aliases in the annotations must not be required.
+        if self.params_adapter is None:
+            params = TypedDict(
+                f"{self.name}_params",
+                {p.name: p.annotation for p in self.signature.parameters.values()},
+            )
+            params.__pydantic_config__ = ConfigDict(populate_by_name=True)
+            self.params_adapter = TypeAdapter(params)
+        return self.params_adapter
@@ -1,8 +1,11 @@
+import inspect
+import json
+from datetime import datetime
 from typing import Annotated, Any
 
 import fastapi
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from rest_rpc import (
     ApiClient,
     ApiDefinition,
@@ -303,3 +306,127 @@ def test_client_validation_error():
     api_client = ApiClient(api_def, engine="testclient", app=app)
     with pytest.raises(ValidationError):
         _ = api_client.simple_route()
+
+
+def test_client_testclient_cookies_isolated():
+    api_def = ApiDefinition()
+
+    @api_def.get("/")
+    def simple_route() -> dict[str, str]: ...
+
+    api_impl = ApiImplementation(api_def)
+
+    @api_impl.handler
+    def simple_route():
+        return {"Hello": "World"}
+
+    app = api_impl.make_fastapi()
+    received_cookies = []
+
+    @app.middleware("http")
+    async def set_cookie(request, call_next):
+        received_cookies.append(dict(request.cookies))
+        response = await call_next(request)
+        response.set_cookie("session", "secret")
+        return response
+
+    api_client = ApiClient(api_def, engine="testclient", app=app)
+    other_client = ApiClient(api_def, engine="testclient", app=app)
+    assert api_client.simple_route() == {"Hello": "World"}
+    assert api_client.simple_route() == {"Hello": "World"}
+    assert other_client.simple_route() == {"Hello": "World"}
+    assert received_cookies == [{}, {"session": "secret"}, {}]
+
+
+def test_client_accessor_introspection():
+    api_def = ApiDefinition()
+
+    @api_def.get("/items/{item_id}")
+    def read_item(
+        item_id: int, q: Annotated[str | None, Query()] = None
+    ) -> dict[str, Any]: ...
+
+    api_client = ApiClient(api_def, engine="custom", transport=lambda request: {})
+    accessor = api_client.read_item
+    assert accessor.__name__ == "read_item"
+    assert inspect.signature(accessor) == inspect.signature(read_item)
+    assert accessor.__annotations__ == read_item.__annotations__
+
+
+def test_client_reserved_route_names():
+    api_def = ApiDefinition()
+
+    @api_def.get("/session")
+    def session() -> int: ...
+
+    @api_def.get("/json_loads")
+    def json_loads() -> int: ...
+
+    with ApiClient(api_def, engine="requests", base_url="http://127.0.0.1") as client:
+        assert callable(client.session)
+        assert callable(client.json_loads)
+
+    api_def = ApiDefinition()
+
+    @api_def.post("/tickets/{ticket_id}/close")
+    def close(ticket_id: int) -> None: ...
+
+    with pytest.raises(ValueError) as exc:
+        ApiClient(api_def, engine="custom", transport=lambda request: None)
+    assert 'Unable to add accessor for route "close"' in str(exc.value)
+
+
+def test_client_response_json_mode():
+    class Event(BaseModel):
+        model_config = ConfigDict(strict=True)
+
+        at: datetime
+
+    api_def = ApiDefinition()
+
+    @api_def.get("/event")
+    def event() -> Event: ...
+
+    @api_def.get("/utf16")
+    def utf16() -> str: ...
+
+    @api_def.get("/latin1")
+    def latin1() -> str: ...
+
+    api_impl = ApiImplementation(api_def)
+
+    @api_impl.handler
+    def event():
+        return fastapi.responses.JSONResponse(content={"at": "2024-01-01T00:00:00"})
+
+    @api_impl.handler
+    def utf16():
+        return fastapi.Response(
+            content='"x"'.encode("utf-16"),
+            media_type="application/json; charset=utf-16",
+        )
+
+    @api_impl.handler
+    def latin1():
+        return fastapi.Response(
+            content='"\xe9"'.encode("latin-1"),
+            media_type="application/json; charset=latin-1",
+        )
+
+    app = api_impl.make_fastapi()
+
+    # By default, the raw body is validated in JSON mode.
+    api_client = ApiClient(api_def, engine="testclient", app=app)
+    assert api_client.event() == Event(at=datetime(2024, 1, 1))
+    with pytest.raises(DecodeError):
+        api_client.utf16()
+    with pytest.raises(DecodeError):
+        api_client.latin1()
+
+    # With `json_loads`, the decoded body is validated in Python mode.
+    api_client = ApiClient(api_def, engine="testclient", app=app, json_loads=json.loads)
+    with pytest.raises(ValidationError):
+        api_client.event()
+    assert api_client.utf16() == "x"
+    with pytest.raises(DecodeError):
+        api_client.latin1()
@@ -1,3 +1,5 @@
+import json
+
 import aiohttp
 import fastapi
 import pytest
@@ -46,6 +48,7 @@ async def test_client_simple(fastapi_server):
                 session=session,
             )
             result = await api_client.simple_route()
+            assert api_client.session is session
     assert result == {"Hello": "World"}
 
 
@@ -144,3 +147,47 @@ async def test_decode_error(fastapi_server):
             )
             with pytest.raises(DecodeError):
                 _ = await api_client.simple_route()
+
+
+@pytest.mark.asyncio
+async def test_custom_json_loads(fastapi_server):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def simple_route():
+            return {"Hello": "World"}
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    decoded = []
+
+    def json_loads(raw: bytes):
+        decoded.append(raw)
+        return json.loads(raw)
+
+    app = api_impl.make_fastapi()
+    with fastapi_server(app) as base_url:
+        async with aiohttp.ClientSession() as session:
+            api_client = ApiClient(
+                api_def,
+                engine="aiohttp",
+                base_url=base_url,
+                session=session,
+                json_loads=json_loads,
+            )
+            result = await api_client.simple_route()
+    assert result == {"Hello": "World"}
+    assert decoded == [b'{"Hello":"World"}']
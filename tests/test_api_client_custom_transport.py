@@ -1,5 +1,16 @@
+from typing import Annotated
+
 import fastapi.testclient
-from rest_rpc import ApiClient, ApiDefinition, ApiImplementation, Request
+import pytest
+from pydantic import BaseModel
+from rest_rpc import (
+    ApiClient,
+    ApiDefinition,
+    ApiImplementation,
+    Body,
+    Request,
+    ValidationError,
+)
 
 
 def test_custom_sync_transport():
@@ -30,3 +41,72 @@ def test_custom_sync_transport():
 
     client = ApiClient(api, engine="custom", transport=transport)
     assert client.root() == {"ok": "yes"}
+
+
+def test_custom_transport_simple_return_types():
+    class Item(BaseModel):
+        name: str
+
+    api = ApiDefinition()
+
+    @api.get("/count")
+    def count() -> int | None: ...
+
+    @api.get("/item")
+    def item() -> Item: ...
+
+    results = {"/count": 42, "/item": Item(name="foo")}
+
+    def transport(request: Request):
+        return results[request.path]
+
+    client = ApiClient(api, engine="custom", transport=transport)
+    assert client.count() == 42
+    assert client.item() is results["/item"]
+
+    results["/count"] = None
+    assert client.count() is None
+
+    results["/count"] = "42"
+    assert client.count() == 42
+
+    results["/count"] = "foo"
+    with pytest.raises(ValidationError):
+        client.count()
+
+
+def test_custom_transport_union_order():
+    api = ApiDefinition()
+
+    @api.get("/a")
+    def a() -> int | float: ...
+
+    @api.get("/b")
+    def b() -> float | int: ...
+
+    client = ApiClient(api, engine="custom", transport=lambda request: "1.0")
+    assert api.routes["a"].return_adapter is not api.routes["b"].return_adapter
+    assert type(client.a()) is int
+    assert type(client.b()) is float
+
+
+def test_custom_transport_body_adapter():
+    class Item(BaseModel):
+        name: str
+
+    class SpecialItem(Item):
+        special: bool = True
+
+    api = ApiDefinition()
+
+    @api.post("/items")
+    def create_item(item: Annotated[Item, Body()]) -> dict: ...
+
+    client = ApiClient(api, engine="custom", transport=lambda request: request.body)
+    assert client.create_item(Item(name="a")) == {"name": "a"}
+    body_adapter = api.routes["create_item"].body_adapter
+    assert body_adapter is not None
+    assert client.create_item(Item(name="b")) == {"name": "b"}
+    assert api.routes["create_item"].body_adapter is body_adapter
+    assert client.create_item(SpecialItem(name="c")) == {"name": "c", "special": True}
+    assert api.routes["create_item"].body_adapter is body_adapter
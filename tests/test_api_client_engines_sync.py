@@ -1,5 +1,7 @@
+import json
+
 import pytest
-from rest_rpc import ApiClient, ApiDefinition, NetworkError
+from rest_rpc import ApiClient, ApiDefinition, ApiImplementation, NetworkError
 
 
 @pytest.mark.parametrize("engine", ["requests", "httpx", "urllib3"])
@@ -17,3 +19,34 @@ def test_network_error(engine):
 
     with pytest.raises(NetworkError):
         client.root()
+
+
+@pytest.mark.parametrize("engine", ["requests", "httpx", "urllib3"])
+def test_custom_json_loads(engine, fastapi_server):
+    api = ApiDefinition()
+
+    @api.get("/")
+    def root() -> dict[str, str]: ...
+
+    impl = ApiImplementation(api)
+
+    @impl.handler
+    def root():
+        return {"ok": "yes"}
+
+    decoded = []
+
+    def json_loads(raw: bytes):
+        decoded.append(raw)
+        return json.loads(raw)
+
+    with fastapi_server(impl.make_fastapi()) as base_url:
+        client = ApiClient(
+            api,
+            engine=engine,
+            base_url=base_url,
+            json_loads=json_loads,
+        )
+        assert client.root() == {"ok": "yes"}
+
+    assert decoded == [b'{"ok":"yes"}']
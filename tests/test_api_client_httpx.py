@@ -1,4 +1,5 @@
 import fastapi
+import httpx
 import pytest
 from rest_rpc import (
     ApiClient,
@@ -163,3 +164,52 @@ def test_validation_error(fastapi_server):
         )
         with pytest.raises(ValidationError):
             _ = api_client.simple_route()
+
+
+def test_client_session_reused(fastapi_server, monkeypatch):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/items/{item_id}")
+        def route_with_arg(item_id: int) -> dict[str, int]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def route_with_arg(item_id):
+            return {"item_id": item_id}
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    client_ports = []
+
+    @app.middleware("http")
+    async def record_client_port(request, call_next):
+        client_ports.append(request.client.port)
+        return await call_next(request)
+
+    closed = []
+    close = httpx.Client.close
+
+    def record_close(self):
+        closed.append(self)
+        close(self)
+
+    monkeypatch.setattr(httpx.Client, "close", record_close)
+
+    with fastapi_server(app) as base_url:
+        with ApiClient(api_def, engine="httpx", base_url=base_url) as api_client:
+            assert api_client.route_with_arg(1) == {"item_id": 1}
+            assert api_client.route_with_arg(2) == {"item_id": 2}
+            assert not closed
+        assert len(closed) == 1
+    # Both requests were sent over the same connection.
+    assert len(client_ports) == 2 and client_ports[0] == client_ports[1]
@@ -0,0 +1,251 @@
+import asyncio
+
+import fastapi
+import httpx
+import pytest
+from rest_rpc import (
+    ApiClient,
+    ApiDefinition,
+    ApiImplementation,
+    DecodeError,
+    HttpError,
+    NetworkError,
+    ValidationError,
+)
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+@pytest.mark.asyncio
+async def test_client_simple_requests(fastapi_server):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def simple_route():
+            return {"Hello": "World"}
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    with fastapi_server(app) as base_url:
+        async with ApiClient(
+            api_def,
+            engine="httpx_async",
+            base_url=base_url,
+        ) as api_client:
+            result = await api_client.simple_route()
+    assert result == {"Hello": "World"}
+
+
+@pytest.mark.asyncio
+async def test_network_error():
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    async with ApiClient(
+        api_def,
+        engine="httpx_async",
+        base_url="http://i-made-up-this-url-4e40ac92-3df4-4aa9-9a6a-d6da534a67cf.org/api",
+    ) as api_client:
+        with pytest.raises(NetworkError):
+            _ = await api_client.simple_route()
+
+
+@pytest.mark.asyncio
+async def test_http_error(fastapi_server):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def simple_route():
+            return fastapi.responses.JSONResponse(
+                content={"Hello": "World"}, status_code=400
+            )
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    with fastapi_server(app) as base_url:
+        async with ApiClient(
+            api_def,
+            engine="httpx_async",
+            base_url=base_url,
+        ) as api_client:
+            with pytest.raises(HttpError):
+                _ = await api_client.simple_route()
+
+
+@pytest.mark.asyncio
+async def test_decode_error(fastapi_server):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def simple_route():
+            return fastapi.Response(content="this is not json", media_type="text/plain")
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    with fastapi_server(app) as base_url:
+        async with ApiClient(
+            api_def,
+            engine="httpx_async",
+            base_url=base_url,
+        ) as api_client:
+            with pytest.raises(DecodeError):
+                _ = await api_client.simple_route()
+
+
+@pytest.mark.asyncio
+async def test_validation_error(fastapi_server):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def simple_route():
+            return fastapi.responses.JSONResponse(content={"Hello": 42})
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    with fastapi_server(app) as base_url:
+        async with ApiClient(
+            api_def,
+            engine="httpx_async",
+            base_url=base_url,
+        ) as api_client:
+            with pytest.raises(ValidationError):
+                _ = await api_client.simple_route()
+
+
+@pytest.mark.asyncio
+async def test_client_concurrent_requests(fastapi_server, monkeypatch):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/items/{item_id}")
+        def route_with_arg(item_id: int) -> dict[str, int]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    def make_impl(api_def):
+        api_impl = ApiImplementation(api_def)
+
+        @api_impl.handler
+        def route_with_arg(item_id):
+            return {"item_id": item_id}
+
+        return api_impl
+
+    api_impl = make_impl(api_def)
+
+    app = api_impl.make_fastapi()
+    closed = []
+    aclose = httpx.AsyncClient.aclose
+
+    async def record_aclose(self):
+        closed.append(self)
+        await aclose(self)
+
+    monkeypatch.setattr(httpx.AsyncClient, "aclose", record_aclose)
+
+    with fastapi_server(app) as base_url:
+        async with ApiClient(
+            api_def, engine="httpx_async", base_url=base_url
+        ) as api_client:
+            results = await asyncio.gather(
+                *(api_client.route_with_arg(i) for i in range(10))
+            )
+            assert not closed
+        assert len(closed) == 1
+    assert results == [{"item_id": i} for i in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_client_sync_close_rejected(monkeypatch):
+    def make_def():
+        api_def = ApiDefinition()
+
+        @api_def.get("/")
+        def simple_route() -> dict[str, str]: ...
+
+        return api_def
+
+    api_def = make_def()
+
+    closed = []
+    aclose = httpx.AsyncClient.aclose
+
+    async def record_aclose(self):
+        closed.append(self)
+        await aclose(self)
+
+    monkeypatch.setattr(httpx.AsyncClient, "aclose", record_aclose)
+
+    api_client = ApiClient(api_def, engine="httpx_async", base_url="http://127.0.0.1")
+    with pytest.raises(TypeError):
+        api_client.close()
+    with pytest.raises(TypeError), api_client:
+        pass
+    assert not closed
+    await api_client.aclose()
+    assert len(closed) == 1
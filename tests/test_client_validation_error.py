@@ -1,6 +1,7 @@
 from typing import Annotated
 
 import pytest
+from pydantic import Field
 from rest_rpc import ApiClient, ApiDefinition, Query
 
 
@@ -26,3 +27,74 @@ def test_client_type_validation_error():
         client.read_number(x="not-an-int")
 
     assert 'Illegal type for parameter "x"' in str(exc.value)
+
+
+def test_client_invalid_arguments():
+    api = ApiDefinition()
+
+    @api.get("/items/{item_id}")
+    def read_item(item_id: int, q: Annotated[str | None, Query()] = None) -> int: ...
+
+    client = ApiClient(api, "custom", transport=lambda request: 0)
+
+    assert client.read_item(1) == 0
+    assert client.read_item(1, q="q") == 0
+    for args, kwargs in [
+        ((), {}),
+        ((1, "q", 2), {}),
+        ((1,), {"unknown": 2}),
+        ((1,), {"item_id": 1}),
+    ]:
+        with pytest.raises(ValueError) as exc:
+            client.read_item(*args, **kwargs)
+        assert 'Unable to use accessor for route "read_item"' in str(exc.value)
+
+
+def test_client_constrained_type_validation_error():
+    api = ApiDefinition()
+
+    @api.get("/numbers")
+    def read_number(x: Annotated[int, Query(), Field(gt=0)]) -> int: ...
+
+    client = ApiClient(api, "custom", transport=lambda request: 0)
+
+    assert client.read_number(x=1) == 0
+    with pytest.raises(ValueError) as exc:
+        client.read_number(x=0)
+
+    assert 'Illegal type for parameter "x"' in str(exc.value)
+
+
+def test_client_field_alias_validation():
+    api = ApiDefinition()
+
+    @api.get("/numbers")
+    def read_number(x: Annotated[int, Query(), Field(alias="xx")]) -> int: ...
+
+    client = ApiClient(api, "custom", transport=lambda request: 0)
+
+    assert client.read_number(x=1) == 0
+    with pytest.raises(ValueError) as exc:
+        client.read_number(x="not-an-int")
+
+    assert 'Illegal type for parameter "x"' in str(exc.value)
+
+
+def test_client_reserved_parameter_names():
+    api = ApiDefinition()
+
+    @api.get("/missing")
+    def read_missing(__missing: Annotated[int, Query()]) -> int: ...
+
+    with pytest.raises(ValueError) as exc:
+        ApiClient(api, "custom", transport=lambda request: 0)
+    assert 'Parameter name "__missing" is reserved' in str(exc.value)
+
+    api = ApiDefinition()
+
+    @api.get("/positional")
+    def read_positional(__positional_0: Annotated[int, Query()]) -> int: ...
+
+    with pytest.raises(ValueError) as exc:
+        ApiClient(api, "custom", transport=lambda request: 0)
+    assert 'Parameter name "__positional_0" is reserved' in str(exc.value)
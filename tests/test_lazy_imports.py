@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import pytest
+
+ENGINE_MODULES = ("aiohttp", "fastapi", "httpx", "requests", "urllib3")
+
+
+@pytest.mark.parametrize("module", ENGINE_MODULES)
+def test_import_does_not_load_engine(module):
+    code = f"import sys, rest_rpc; sys.exit({module!r} in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 0, f'Importing rest_rpc imported "{module}".'
+
+
+def test_client_only_loads_its_engine():
+    code = (
+        "import sys\n"
+        "from rest_rpc import ApiClient, ApiDefinition\n"
+        "api = ApiDefinition()\n"
+        "@api.get('/')\n"
+        "def root() -> dict[str, str]: ...\n"
+        "ApiClient(api, engine='urllib3', base_url='http://127.0.0.1')\n"
+        f"sys.exit(any(m in sys.modules for m in {('aiohttp', 'fastapi', 'requests')!r}))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 0